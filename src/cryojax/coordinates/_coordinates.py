@@ -2,14 +2,19 @@
 Coordinate functionality in cryojax.
 """
 
+import dataclasses
+import functools
+
 from jaxtyping import ArrayLike, Array, PyTree, Float
 from typing import Optional, Any
 from typing_extensions import Self
 from equinox import AbstractVar
 
 import equinox as eqx
+import jax
 import jax.tree_util as jtu
 import jax.numpy as jnp
+import numpy as np
 
 from ..typing import (
     Image,
@@ -32,40 +37,111 @@ def is_not_coordinates(element: Any) -> bool:
         return eqx.is_array(element)
 
 
+def _is_not_coordinates_type(leaf_type: type) -> bool:
+    """``is_not_coordinates``, evaluated on the type of a leaf."""
+    if issubclass(leaf_type, AbstractCoordinates):
+        return False
+    else:
+        # Match the classes accepted by ``eqx.is_array``.
+        return issubclass(leaf_type, (np.ndarray, np.generic, jax.Array))
+
+
 #
 # Common filter specs
 #
 def get_not_coordinate_filter_spec(pytree: PyTree) -> PyTree[bool]:
     """Filter spec that is ``True`` for all arrays that are not ``Coordinates``."""
-    return jtu.tree_map(
-        is_not_coordinates,
-        pytree,
-        is_leaf=lambda x: isinstance(x, AbstractCoordinates),
+    leaves, treedef = jtu.tree_flatten(
+        pytree, is_leaf=lambda x: isinstance(x, AbstractCoordinates)
     )
+    leaf_types = tuple(type(leaf) for leaf in leaves)
+    try:
+        return _filter_spec_from_leaf_types(treedef, leaf_types)
+    except TypeError:
+        # The tree structure holds unhashable static metadata, so it
+        # cannot be used as a cache key.
+        return jtu.tree_unflatten(
+            treedef, [_is_not_coordinates_type(leaf_type) for leaf_type in leaf_types]
+        )
+
+
+@functools.lru_cache(maxsize=None)
+def _filter_spec_from_leaf_types(
+    treedef: Any, leaf_types: tuple[type, ...]
+) -> PyTree[bool]:
+    """Cache the filter spec on the tree structure and its leaf types,
+    so repeated calls on same-structured pytrees skip the per-leaf
+    ``isinstance`` dispatch."""
+    return jtu.tree_unflatten(
+        treedef, [_is_not_coordinates_type(leaf_type) for leaf_type in leaf_types]
+    )
+
+
+def _as_operand(arr: ArrayLike) -> ArrayLike:
+    """Prepare a scalar operand for coordinate arithmetic.
+
+    Arrays already on device and python scalars are consumed by jax
+    natively, so only wrap operands that would otherwise trigger an
+    ``asarray`` round-trip per operation.
+    """
+    if isinstance(arr, (jax.Array, int, float)):
+        return arr
+    else:
+        return jnp.asarray(arr)
+
+
+def _to_coordinate_array(
+    array: ArrayLike | eqx.internal.Static,
+) -> Array | eqx.internal.Static:
+    """Field converter that leaves compile-time constant coordinates alone."""
+    if isinstance(array, eqx.internal.Static):
+        return array
+    else:
+        return jnp.asarray(array)
 
 
 class AbstractCoordinates(eqx.Module, strict=True):
     """
     A base class that wraps a coordinate array.
+
+    If the coordinates are wrapped in ``equinox.internal.Static``,
+    they are treated as a compile-time constant rather than a traced
+    array.
     """
 
     array: AbstractVar[Any]
 
     def get(self):
         """Get the coordinates."""
-        return self.array
+        if isinstance(self.array, eqx.internal.Static):
+            return self.array.value
+        else:
+            return self.array
+
+    def _replace_array(self, array: Array) -> Self:
+        """Rebuild ``self`` with a new wrapped array.
+
+        This uses the same escape hatch as equinox to set the field on
+        a frozen module, avoiding the pytree walk of ``eqx.tree_at``
+        for this hot single-field update.
+        """
+        replaced = object.__new__(type(self))
+        for field in dataclasses.fields(self):
+            object.__setattr__(replaced, field.name, getattr(self, field.name))
+        object.__setattr__(replaced, "array", array)
+        return replaced
 
     def __mul__(self, arr: ArrayLike) -> Self:
-        return eqx.tree_at(lambda x: x.array, self, self.array * jnp.asarray(arr))
+        return self._replace_array(self.get() * _as_operand(arr))
 
     def __rmul__(self, arr: ArrayLike) -> Self:
-        return eqx.tree_at(lambda x: x.array, self, jnp.asarray(arr) * self.array)
+        return self._replace_array(_as_operand(arr) * self.get())
 
     def __truediv__(self, arr: ArrayLike) -> Self:
-        return eqx.tree_at(lambda x: x.array, self, self.array / jnp.asarray(arr))
+        return self._replace_array(self.get() / _as_operand(arr))
 
     def __rtruediv__(self, arr: ArrayLike) -> Self:
-        return eqx.tree_at(lambda x: x.array, self, jnp.asarray(arr) / self.array)
+        return self._replace_array(_as_operand(arr) / self.get())
 
 
 class CoordinateList(AbstractCoordinates, strict=True):
@@ -84,14 +160,25 @@ class CoordinateGrid(AbstractCoordinates, strict=True):
     A Pytree that wraps a coordinate grid.
     """
 
-    array: ImageCoords | VolumeCoords = eqx.field(converter=jnp.asarray)
+    array: ImageCoords | VolumeCoords | eqx.internal.Static = eqx.field(
+        converter=_to_coordinate_array
+    )
+    indexing: str = eqx.field(static=True)
 
     def __init__(
         self,
         shape: tuple[int, int] | tuple[int, int, int],
         grid_spacing: float | ArrayLike = 1.0,
+        static: bool = False,
+        indexing: str = "xy",
     ):
-        self.array = make_coordinates(shape, grid_spacing)
+        """If ``static = True``, store the grid as a compile-time
+        constant rather than a traced array. ``indexing = "ij"``
+        builds the grid in matrix indexing, so that consumers indexing
+        the grid row-major do not need a transpose."""
+        self.indexing = indexing
+        array = make_coordinates(shape, grid_spacing, indexing=indexing)
+        self.array = eqx.internal.Static(array) if static else array
 
 
 class FrequencyGrid(AbstractCoordinates, strict=True):
@@ -99,15 +186,21 @@ class FrequencyGrid(AbstractCoordinates, strict=True):
     A Pytree that wraps a frequency grid.
     """
 
-    array: ImageCoords | VolumeCoords = eqx.field(converter=jnp.asarray)
+    array: ImageCoords | VolumeCoords | eqx.internal.Static = eqx.field(
+        converter=_to_coordinate_array
+    )
 
     def __init__(
         self,
         shape: tuple[int, int] | tuple[int, int, int],
         grid_spacing: float | ArrayLike = 1.0,
         half_space: bool = True,
+        static: bool = False,
     ):
-        self.array = make_frequencies(shape, grid_spacing, half_space=half_space)
+        """If ``static = True``, store the grid as a compile-time
+        constant rather than a traced array."""
+        array = make_frequencies(shape, grid_spacing, half_space=half_space)
+        self.array = eqx.internal.Static(array) if static else array
 
 
 class FrequencySlice(AbstractCoordinates, strict=True):
@@ -118,33 +211,43 @@ class FrequencySlice(AbstractCoordinates, strict=True):
     component in the center.
     """
 
-    array: VolumeSliceCoords = eqx.field(converter=jnp.asarray)
+    array: VolumeSliceCoords | eqx.internal.Static = eqx.field(
+        converter=_to_coordinate_array
+    )
 
     def __init__(
         self,
         shape: tuple[int, int],
         grid_spacing: float | ArrayLike = 1.0,
         half_space: bool = True,
+        static: bool = False,
     ):
-        frequency_slice = make_frequencies(shape, grid_spacing, half_space=half_space)
-        if half_space:
-            frequency_slice = jnp.fft.fftshift(frequency_slice, axes=(0,))
-        else:
-            frequency_slice = jnp.fft.fftshift(frequency_slice, axes=(0, 1))
-        frequency_slice = jnp.expand_dims(
-            jnp.pad(
-                frequency_slice,
-                ((0, 0), (0, 0), (0, 1)),
-                mode="constant",
-                constant_values=0.0,
-            ),
-            axis=2,
+        """If ``static = True``, store the slice as a compile-time
+        constant rather than a traced array."""
+        # Build the full-space frequency axes directly in shifted order,
+        # rather than post-hoc fftshifting the stacked grid.
+        frequency_slice = _make_coordinates_or_frequencies(
+            shape,
+            grid_spacing=grid_spacing,
+            real_space=False,
+            half_space=half_space,
+            shifted=True,
+        )
+        # Scatter the 2D frequencies into an array allocated at the final
+        # shape, rather than padding and expanding in separate passes. The
+        # third coordinate of the slice is identically zero.
+        frequency_slice = jnp.zeros(
+            (*frequency_slice.shape[:2], 1, 3), dtype=frequency_slice.dtype
+        ).at[:, :, 0, :2].set(frequency_slice)
+        self.array = (
+            eqx.internal.Static(frequency_slice) if static else frequency_slice
         )
-        self.array = frequency_slice
 
 
 def make_coordinates(
-    shape: tuple[int, ...], grid_spacing: float | ArrayLike = 1.0
+    shape: tuple[int, ...],
+    grid_spacing: float | ArrayLike = 1.0,
+    indexing: str = "xy",
 ) -> Float[Array, "*shape len(shape)"]:
     """
     Create a real-space cartesian coordinate system on a grid.
@@ -156,15 +259,26 @@ def make_coordinates(
         ``ndim = len(shape)``.
     grid_spacing :
         The grid spacing, in units of length.
+    indexing :
+        Either ``"xy"`` or ``"ij"``, passed with the convention
+        of ``jnp.meshgrid``.
 
     Returns
     -------
     coordinate_grid :
         Cartesian coordinate system in real space.
     """
-    coordinate_grid = _make_coordinates_or_frequencies(
-        shape, grid_spacing=grid_spacing, real_space=True, indexing="xy"
-    )
+    if isinstance(grid_spacing, (int, float)):
+        # With a concrete grid spacing the grid is a constant, so build
+        # it with numpy and skip the XLA dispatch overhead of eager
+        # construction. Inside a trace, the result is constant-folded.
+        coordinate_grid = jnp.asarray(
+            _make_coordinates_with_numpy(shape, grid_spacing, indexing=indexing)
+        )
+    else:
+        coordinate_grid = _make_coordinates_or_frequencies(
+            shape, grid_spacing=grid_spacing, real_space=True, indexing=indexing
+        )
     return coordinate_grid
 
 
@@ -218,12 +332,21 @@ def cartesian_to_polar(freqs: ImageCoords, square: bool = False) -> tuple[Image,
         return :math:`|r|`.
     """
     theta = jnp.arctan2(freqs[..., 0], freqs[..., 1])
-    k_sqr = jnp.sum(jnp.square(freqs), axis=-1)
-    if square:
-        return k_sqr, theta
+    if freqs.shape[-1] == 2:
+        # hypot computes the radius in one pass over the components and
+        # does not overflow far from the origin in single precision.
+        kr = jnp.hypot(freqs[..., 0], freqs[..., 1])
+        if square:
+            return jnp.square(kr), theta
+        else:
+            return kr, theta
     else:
-        kr = jnp.sqrt(k_sqr)
-        return kr, theta
+        k_sqr = jnp.sum(jnp.square(freqs), axis=-1)
+        if square:
+            return k_sqr, theta
+        else:
+            kr = jnp.sqrt(k_sqr)
+            return kr, theta
 
 
 def _make_coordinates_or_frequencies(
@@ -232,30 +355,174 @@ def _make_coordinates_or_frequencies(
     real_space: bool = False,
     half_space: bool = True,
     indexing: str = "xy",
+    shifted: bool = False,
 ) -> Float[Array, "*shape len(shape)"]:
+    coords1D = _make_1d_coordinate_axes(
+        shape,
+        grid_spacing,
+        real_space=real_space,
+        half_space=half_space,
+        indexing=indexing,
+        shifted=shifted,
+    )
+    return _broadcast_coordinate_axes(coords1D, indexing=indexing)
+
+
+def _make_1d_coordinate_axes(
+    shape: tuple[int, ...],
+    grid_spacing: float | ArrayLike = 1.0,
+    real_space: bool = False,
+    half_space: bool = True,
+    indexing: str = "xy",
+    shifted: bool = False,
+) -> tuple[Float[Array, " size"], ...]:
+    """Build the per-axis 1D coordinates, in struct-of-arrays layout.
+
+    The 2D and 3D cases are unrolled into explicit per-axis calls.
+    If ``shifted = True``, build full-space frequency axes directly in
+    fftshifted order. Half-space axes are always left unshifted.
+    """
     ndim = len(shape)
     shape = (*shape[:2][::-1], *shape[2:]) if indexing == "xy" else shape
-    coords1D = []
-    for idx in range(ndim):
+    if ndim == 2:
+        return _make_2d_coordinate_axes(
+            shape, grid_spacing, real_space, half_space, indexing, shifted
+        )
+    elif ndim == 3:
+        return _make_3d_coordinate_axes(
+            shape, grid_spacing, real_space, half_space, shifted
+        )
+    else:
+        # Generic fallback for other dimensionality, with the
+        # half-space axis last.
         if real_space:
-            c1D = _make_coordinates_or_frequencies_1d(
-                shape[idx], grid_spacing, real_space
+            rfftfreqs = ndim * (None,)
+        elif half_space:
+            rfftfreqs = (*(ndim - 1) * (False,), True)
+        else:
+            rfftfreqs = ndim * (False,)
+        return tuple(
+            _make_coordinates_or_frequencies_1d(
+                shape[idx], grid_spacing, real_space, rfftfreqs[idx], shifted=shifted
+            )
+            for idx in range(ndim)
+        )
+
+
+def _make_2d_coordinate_axes(
+    shape: tuple[int, int],
+    grid_spacing: float | ArrayLike,
+    real_space: bool,
+    half_space: bool,
+    indexing: str,
+    shifted: bool,
+) -> tuple[Float[Array, " size"], Float[Array, " size"]]:
+    make_1d = _make_coordinates_or_frequencies_1d
+    if real_space:
+        return (
+            make_1d(shape[0], grid_spacing, True),
+            make_1d(shape[1], grid_spacing, True),
+        )
+    elif half_space:
+        # With "xy" indexing the first axis is the half-space axis,
+        # otherwise the last.
+        if indexing == "xy":
+            return (
+                make_1d(shape[0], grid_spacing, False, True, shifted=shifted),
+                make_1d(shape[1], grid_spacing, False, False, shifted=shifted),
             )
         else:
-            if not half_space:
-                rfftfreq = False
-            else:
-                if indexing == "xy" and ndim == 2:
-                    rfftfreq = True if idx == 0 else False
-                else:
-                    rfftfreq = False if idx < ndim - 1 else True
-            c1D = _make_coordinates_or_frequencies_1d(
-                shape[idx], grid_spacing, real_space, rfftfreq
+            return (
+                make_1d(shape[0], grid_spacing, False, False, shifted=shifted),
+                make_1d(shape[1], grid_spacing, False, True, shifted=shifted),
             )
-        coords1D.append(c1D)
-    coords = jnp.stack(jnp.meshgrid(*coords1D, indexing=indexing), axis=-1)
+    else:
+        return (
+            make_1d(shape[0], grid_spacing, False, False, shifted=shifted),
+            make_1d(shape[1], grid_spacing, False, False, shifted=shifted),
+        )
+
+
+def _make_3d_coordinate_axes(
+    shape: tuple[int, int, int],
+    grid_spacing: float | ArrayLike,
+    real_space: bool,
+    half_space: bool,
+    shifted: bool,
+) -> tuple[Float[Array, " size"], Float[Array, " size"], Float[Array, " size"]]:
+    make_1d = _make_coordinates_or_frequencies_1d
+    if real_space:
+        return (
+            make_1d(shape[0], grid_spacing, True),
+            make_1d(shape[1], grid_spacing, True),
+            make_1d(shape[2], grid_spacing, True),
+        )
+    else:
+        return (
+            make_1d(shape[0], grid_spacing, False, False, shifted=shifted),
+            make_1d(shape[1], grid_spacing, False, False, shifted=shifted),
+            make_1d(shape[2], grid_spacing, False, half_space, shifted=shifted),
+        )
+
+
+def _broadcast_coordinate_axes(
+    coords1D: tuple[Float[Array, " size"], ...], indexing: str = "xy"
+) -> Float[Array, "*shape len(shape)"]:
+    """Materialize a coordinate grid from its 1D axes with broadcasting.
+
+    This matches the convention of ``jnp.meshgrid``, but never
+    materializes the ``ndim`` intermediate arrays that ``jnp.meshgrid``
+    followed by ``jnp.stack`` would.
+    """
+    ndim = len(coords1D)
+    if indexing == "xy" and ndim >= 2:
+        # With "xy" indexing, the first axis varies along the second
+        # dimension and vice-versa.
+        output_dims = (1, 0, *range(2, ndim))
+    else:
+        output_dims = tuple(range(ndim))
+    full_shape = [0] * ndim
+    for idx, dim in enumerate(output_dims):
+        full_shape[dim] = coords1D[idx].size
+    components = []
+    for idx, dim in enumerate(output_dims):
+        broadcast_shape = [1] * ndim
+        broadcast_shape[dim] = coords1D[idx].size
+        components.append(
+            jnp.broadcast_to(coords1D[idx].reshape(broadcast_shape), full_shape)
+        )
+    return jnp.stack(components, axis=-1)
 
-    return coords
+
+def _make_coordinates_with_numpy(
+    shape: tuple[int, ...], grid_spacing: float, indexing: str = "xy"
+) -> np.ndarray:
+    """Eagerly build a real-space coordinate grid with numpy.
+
+    This mirrors ``_make_coordinates_or_frequencies`` with
+    ``real_space=True``.
+    """
+    ndim = len(shape)
+    shape = (*shape[:2][::-1], *shape[2:]) if indexing == "xy" else shape
+    coords1D = tuple(
+        np.arange(-(size // 2), size - size // 2, dtype=float) * grid_spacing
+        for size in shape
+    )
+    if indexing == "xy" and ndim >= 2:
+        output_dims = (1, 0, *range(2, ndim))
+    else:
+        output_dims = tuple(range(ndim))
+    full_shape = [0] * ndim
+    for idx, dim in enumerate(output_dims):
+        full_shape[dim] = coords1D[idx].size
+    components = []
+    for idx, dim in enumerate(output_dims):
+        broadcast_shape = [1] * ndim
+        broadcast_shape[dim] = coords1D[idx].size
+        components.append(
+            np.broadcast_to(coords1D[idx].reshape(broadcast_shape), full_shape)
+        )
+    return np.stack(components, axis=-1)
 
 
 def _make_coordinates_or_frequencies_1d(
@@ -263,17 +530,22 @@ def _make_coordinates_or_frequencies_1d(
     grid_spacing: float | ArrayLike,
     real_space: bool = False,
     rfftfreq: Optional[bool] = None,
+    shifted: bool = False,
 ) -> Float[Array, "size"]:
     """One-dimensional coordinates in real or fourier space"""
     if real_space:
-        make_1d = (
-            lambda size, dx: jnp.fft.fftshift(jnp.fft.fftfreq(size, 1 / dx)) * size
-        )
+        # Centered coordinates, emitted directly in a single allocation
+        # for both even and odd sizes. The float dtype keeps the grid
+        # floating-point for integer grid spacings.
+        return jnp.arange(-(size // 2), size - size // 2, dtype=float) * grid_spacing
     else:
         if rfftfreq is None:
             raise ValueError("Argument rfftfreq cannot be None if real_space=False.")
+        elif rfftfreq:
+            return jnp.fft.rfftfreq(size, grid_spacing)
+        elif shifted:
+            # Frequencies directly in fftshifted order, avoiding the
+            # full-array copy of a post-hoc fftshift.
+            return (jnp.arange(size) - size // 2) / (size * grid_spacing)
         else:
-            fn = jnp.fft.rfftfreq if rfftfreq else jnp.fft.fftfreq
-            make_1d = lambda size, dx: fn(size, grid_spacing)
-
-    return make_1d(size, grid_spacing)
+            return jnp.fft.fftfreq(size, grid_spacing)
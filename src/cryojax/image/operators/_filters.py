@@ -179,15 +179,19 @@ def _compute_lowpass_filter(
 
     freqs_norm = jnp.linalg.norm(frequency_grid, axis=-1)
 
-    frequencies_cut = freqs_norm > k_cut
-
     rolloff_width = rolloff * k_max
-    mask = 0.5 * (
-        1 + jnp.cos((freqs_norm - k_cut - rolloff_width) / rolloff_width * jnp.pi)
+    # Transition coordinate of the rolloff band, clamped so that the
+    # cosine saturates to 1 below the cutoff and 0 above it. This is
+    # branchless and equivalent to the three-region piecewise form.
+    # Clamp the width away from zero so that a hard cutoff
+    # (rolloff = 0) stays NaN-free, with the cutoff itself kept at 1.
+    band_coordinate = jnp.clip(
+        (freqs_norm - (k_cut - rolloff_width))
+        / jnp.maximum(rolloff_width, jnp.finfo(freqs_norm.dtype).eps),
+        0.0,
+        1.0,
     )
-
-    mask = jnp.where(frequencies_cut, 0.0, mask)
-    mask = jnp.where(freqs_norm <= k_cut - rolloff_width, 1.0, mask)
+    mask = 0.5 * (1 + jnp.cos(jnp.pi * band_coordinate))
 
     return mask
 
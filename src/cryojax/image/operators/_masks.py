@@ -2,13 +2,16 @@
 Masks to apply to images in real space.
 """
 
+import functools
 from typing import overload
+from typing_extensions import Self
 from equinox import field
 
 import jax
 import jax.numpy as jnp
 
 from ._operator import AbstractImageMultiplier
+from ...coordinates import make_coordinates
 from ...typing import RealImage, RealVolume, ImageCoords, VolumeCoords
 
 
@@ -46,6 +49,11 @@ class CircularMask(AbstractMask, strict=True):
     ``cryojax.simulator.compute_circular_mask``
     for more information.
 
+    The ``coordinate_grid_in_angstroms`` must be a centered grid built
+    by ``make_coordinates`` (the rolloff scale is read from the grid
+    corner, which is only its maximum radius for such grids). For
+    masks on other coordinate systems, use ``CustomMask``.
+
     Attributes
     ----------
     radius :
@@ -71,6 +79,48 @@ class CircularMask(AbstractMask, strict=True):
             coordinate_grid_in_angstroms, self.radius, self.rolloff
         )
 
+    @classmethod
+    def from_shape(
+        cls,
+        shape: tuple[int, ...],
+        grid_spacing: float = 1.0,
+        *,
+        radius: float,
+        rolloff: float = 0.05,
+    ) -> Self:
+        """Build the mask from a shape and grid spacing.
+
+        Because all arguments are static, the mask buffer is compiled
+        and cached per unique set of arguments, so loops that re-create
+        the same mask pay construction cost only once.
+        """
+        mask = object.__new__(cls)
+        object.__setattr__(mask, "radius", radius)
+        object.__setattr__(mask, "rolloff", rolloff)
+        object.__setattr__(
+            mask,
+            "buffer",
+            _compute_circular_mask_with_cache(shape, grid_spacing, radius, rolloff),
+        )
+        return mask
+
+
+@functools.lru_cache(maxsize=None)
+def _compute_circular_mask_with_cache(
+    shape: tuple[int, ...],
+    grid_spacing: float,
+    radius: float,
+    rolloff: float,
+) -> RealImage | RealVolume:
+    """Build a circular mask from static arguments, compiling and
+    caching the result per unique set of arguments."""
+    build = jax.jit(
+        lambda: _compute_circular_mask(
+            make_coordinates(shape, grid_spacing), radius, rolloff
+        )
+    )
+    return build()
+
 
 @overload
 def _compute_circular_mask(
@@ -99,7 +149,8 @@ def _compute_circular_mask(
     Parameters
     ----------
     coordinate_grid :
-        The image coordinates.
+        The image coordinates. These must be a centered grid built by
+        ``make_coordinates``, whose maximum radius lies at the corner.
     grid_spacing :
         The grid spacing of ``coordinate_grid``.
     cutoff :
@@ -118,14 +169,24 @@ def _compute_circular_mask(
     coords_norm = jnp.linalg.norm(coordinate_grid_in_angstroms, axis=-1)
     r_cut = radius
 
-    coords_cut = coords_norm > r_cut
-
-    rolloff_width = rolloff * coords_norm.max()
-    mask = 0.5 * (
-        1 + jnp.cos((coords_norm - r_cut - rolloff_width) / rolloff_width * jnp.pi)
+    # A grid built by `make_coordinates` attains its maximum radius at
+    # the most-negative corner, so read the corner coordinate directly
+    # instead of running a full reduction over the grid.
+    corner_coordinate = coordinate_grid_in_angstroms[
+        (0,) * (coordinate_grid_in_angstroms.ndim - 1)
+    ]
+    rolloff_width = rolloff * jnp.linalg.norm(corner_coordinate)
+    # Transition coordinate of the rolloff band, clamped so that the
+    # cosine saturates to 1 inside the mask and 0 outside of it. This
+    # is branchless and equivalent to the three-region piecewise form.
+    # Clamp the width away from zero so that a hard-edged mask
+    # (rolloff = 0) stays NaN-free, with the edge itself kept at 1.
+    band_coordinate = jnp.clip(
+        (coords_norm - (r_cut - rolloff_width))
+        / jnp.maximum(rolloff_width, jnp.finfo(coords_norm.dtype).eps),
+        0.0,
+        1.0,
     )
-
-    mask = jnp.where(coords_cut, 0.0, mask)
-    mask = jnp.where(coords_norm <= r_cut - rolloff_width, 1.0, mask)
+    mask = 0.5 * (1 + jnp.cos(jnp.pi * band_coordinate))
 
     return mask
@@ -3,6 +3,7 @@ Abstraction of the ice in a cryo-EM image.
 """
 
 from abc import abstractmethod
+from typing import Any, Optional
 from typing_extensions import override
 from equinox import field
 
@@ -13,7 +14,7 @@ from jaxtyping import PRNGKeyArray
 from ._stochastic_model import AbstractStochasticModel
 from ._config import ImageConfig
 from ..image.operators import FourierOperatorLike, FourierExp2D
-from ..typing import ComplexImage, ImageCoords
+from ..typing import ComplexImage, ImageCoords, RealImage
 
 
 class AbstractIce(AbstractStochasticModel, strict=True):
@@ -55,7 +56,13 @@ class NullIce(AbstractIce, strict=True):
         key: PRNGKeyArray,
         frequency_grid_in_angstroms: ImageCoords,
     ) -> ComplexImage:
-        return jnp.zeros(frequency_grid_in_angstroms.shape[0:-1])
+        # Broadcast a scalar zero rather than materializing a full
+        # array of zeros; XLA propagates this as a constant and can
+        # eliminate the downstream add entirely.
+        return jnp.broadcast_to(
+            jnp.zeros((), dtype=jnp.result_type(complex)),
+            frequency_grid_in_angstroms.shape[0:-1],
+        )
 
 
 class GaussianIce(AbstractIce, strict=True):
@@ -68,9 +75,44 @@ class GaussianIce(AbstractIce, strict=True):
         A kernel that computes the variance
         of the ice, modeled as noise. By default,
         ``FourierExp()``.
+    dtype :
+        The complex dtype at which to sample the ice. Pass
+        ``jnp.complex64`` to halve the bandwidth of the stochastic
+        path when running in double precision. By default, ``None``,
+        which resolves to the default complex dtype.
+    variance_buffer :
+        The variance kernel, evaluated ahead of time on the frequency
+        grid passed at initialization. When set, ``sample`` skips the
+        kernel evaluation and multiplies against this buffer directly.
     """
 
-    variance: FourierOperatorLike = field(default_factory=FourierExp2D)
+    variance: FourierOperatorLike
+    dtype: Any = field(static=True)
+    variance_buffer: Optional[RealImage]
+
+    def __init__(
+        self,
+        variance: Optional[FourierOperatorLike] = None,
+        dtype: Any = None,
+        *,
+        frequency_grid_in_angstroms: Optional[ImageCoords] = None,
+    ):
+        """**Arguments:**
+
+        `frequency_grid_in_angstroms`: If given, evaluate the variance
+                                       kernel on this grid ahead of time.
+                                       The grid must match the one later
+                                       passed to `sample`.
+        """
+        self.variance = FourierExp2D() if variance is None else variance
+        self.dtype = dtype
+        if frequency_grid_in_angstroms is None:
+            self.variance_buffer = None
+        else:
+            self.variance_buffer = _mask_zero_frequency(
+                self.variance(frequency_grid_in_angstroms),
+                frequency_grid_in_angstroms,
+            )
 
     @override
     def sample(
@@ -80,10 +122,45 @@ class GaussianIce(AbstractIce, strict=True):
     ) -> ComplexImage:
         """Sample from a gaussian noise model, with the variance
         modulated by the CTF."""
-        ice_image = self.variance(frequency_grid_in_angstroms) * jr.normal(
-            key,
-            shape=frequency_grid_in_angstroms.shape[0:-1],
-            dtype=complex,
-        )
-        ice_image = ice_image.at[0, 0].set(0.0 + 0.0j)
-        return ice_image
+        shape = frequency_grid_in_angstroms.shape[0:-1]
+        dtype = jnp.result_type(complex) if self.dtype is None else self.dtype
+        real_dtype = jnp.finfo(dtype).dtype
+        # Draw the real and imaginary parts in one block and combine with
+        # a 1 / sqrt(2) scaling, so that each bin is a standard complex
+        # normal draw.
+        gaussian = jr.normal(key, shape=(*shape, 2), dtype=real_dtype)
+        noise = (gaussian[..., 0] + 1j * gaussian[..., 1]) / jnp.sqrt(2)
+        # Self-conjugate bins of the fourier transform of a real-valued
+        # ice field must be real. The zero-frequency bin is zeroed below;
+        # for an even number of rows, the nyquist bin of the zero-frequency
+        # column is also its own conjugate partner, so overwrite it with a
+        # unit-variance real draw.
+        if shape[0] % 2 == 0:
+            noise = noise.at[shape[0] // 2, 0].set(gaussian[shape[0] // 2, 0, 0])
+        if self.variance_buffer is not None:
+            variance = self.variance_buffer
+            if variance.shape != shape:
+                raise ValueError(
+                    f"The precomputed variance_buffer has shape {variance.shape}, "
+                    f"which does not match the shape {shape} of the frequency "
+                    "grid passed to sample."
+                )
+        else:
+            # Fold the zeroing of the DC bin into the variance so that
+            # XLA fuses it into the multiply, rather than scattering
+            # into the sampled image afterwards.
+            variance = _mask_zero_frequency(
+                self.variance(frequency_grid_in_angstroms),
+                frequency_grid_in_angstroms,
+            )
+        return variance.astype(real_dtype) * noise
+
+
+def _mask_zero_frequency(
+    variance: RealImage, frequency_grid_in_angstroms: ImageCoords
+) -> RealImage:
+    """Zero the variance at the zero-frequency bin of the grid."""
+    is_dc = (frequency_grid_in_angstroms[..., 0] == 0.0) & (
+        frequency_grid_in_angstroms[..., 1] == 0.0
+    )
+    return jnp.where(is_dc, 0.0, variance)
@@ -0,0 +1,38 @@
+import jax
+import jax.tree_util as jtu
+import numpy as np
+import pytest
+
+from cryojax.coordinates import CoordinateGrid, FrequencyGrid, FrequencySlice
+
+
+@pytest.mark.parametrize("cls", [CoordinateGrid, FrequencyGrid, FrequencySlice])
+def test_static_grid_has_no_array_leaves(cls):
+    """A static grid is carried in the pytree structure, not as a leaf."""
+    grid = cls((8, 8), 1.0, static=True)
+    assert jtu.tree_leaves(grid) == []
+    np.testing.assert_array_equal(grid.get(), cls((8, 8), 1.0).get())
+
+
+def test_static_grid_under_jit():
+    """A static grid folds into a jitted computation as a constant."""
+    grid = CoordinateGrid((8, 8), 1.0, static=True)
+
+    @jax.jit
+    def compute_in_angstroms(grid, pixel_size):
+        return (pixel_size * grid).get()
+
+    np.testing.assert_allclose(
+        compute_in_angstroms(grid, 1.5),
+        1.5 * CoordinateGrid((8, 8), 1.0).get(),
+    )
+
+
+def test_static_grid_arithmetic_returns_traced_grid():
+    """Arithmetic on a static grid returns a regular traced grid."""
+    grid = CoordinateGrid((8, 8), 1.0, static=True)
+    rescaled = grid * 2.0
+    assert len(jtu.tree_leaves(rescaled)) == 1
+    np.testing.assert_array_equal(
+        rescaled.get(), 2.0 * CoordinateGrid((8, 8), 1.0).get()
+    )
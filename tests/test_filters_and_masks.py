@@ -2,8 +2,12 @@ import pytest
 import equinox as eqx
 import jax
 import jax.numpy as jnp
+import jax.tree_util as jtu
 import numpy as np
 
+from cryojax.coordinates import make_coordinates, make_frequencies
+from cryojax.image import operators as op
+
 
 @pytest.mark.parametrize("model", ["noisy_model"])
 def test_compute_with_filters_and_masks(
@@ -38,3 +42,41 @@ def test_compute_with_filters_and_masks(
     np.testing.assert_allclose(model_with_null_mask.sample(key), noisy_image)
     np.testing.assert_allclose(model_with_null_filter.sample(key), noisy_image)
     np.testing.assert_allclose(model_with_null_filter_and_mask.sample(key), noisy_image)
+
+
+def test_CircularMask_from_shape():
+    """Make sure the cached constructor agrees with the array-based one."""
+    shape, grid_spacing, radius = (65, 66), 4.4, 88.0
+    mask = op.CircularMask(make_coordinates(shape, grid_spacing), radius=radius)
+    mask_from_shape = op.CircularMask.from_shape(shape, grid_spacing, radius=radius)
+    assert mask_from_shape.radius == mask.radius
+    assert mask_from_shape.rolloff == mask.rolloff
+    np.testing.assert_allclose(mask_from_shape.buffer, mask.buffer, atol=1e-12)
+    # The instance is a well-formed pytree
+    leaves, treedef = jtu.tree_flatten(mask_from_shape)
+    assert eqx.tree_equal(jtu.tree_unflatten(treedef, leaves), mask_from_shape)
+    # Repeated calls reuse the cached buffer
+    assert (
+        op.CircularMask.from_shape(shape, grid_spacing, radius=radius).buffer
+        is mask_from_shape.buffer
+    )
+
+
+def test_zero_rolloff_gives_hard_edge():
+    """Make sure a zero rolloff gives a NaN-free hard edge."""
+    # ... for the circular mask
+    coordinate_grid = make_coordinates((8, 8))
+    radius = 2.0
+    mask = op.CircularMask(coordinate_grid, radius, rolloff=0.0)
+    coords_norm = jnp.linalg.norm(coordinate_grid, axis=-1)
+    np.testing.assert_array_equal(
+        mask.buffer, jnp.where(coords_norm > radius, 0.0, 1.0)
+    )
+    # ... and for the lowpass filter
+    frequency_grid = make_frequencies((16, 16), half_space=False)
+    cutoff = 0.5
+    filter = op.LowpassFilter(frequency_grid, cutoff=cutoff, rolloff=0.0)
+    freqs_norm = jnp.linalg.norm(frequency_grid, axis=-1)
+    np.testing.assert_array_equal(
+        filter.buffer, jnp.where(freqs_norm > cutoff / 2.0, 0.0, 1.0)
+    )
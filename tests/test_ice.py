@@ -0,0 +1,43 @@
+import pytest
+import jax
+import jax.numpy as jnp
+import jax.random as jr
+import numpy as np
+
+import cryojax.simulator as cs
+from cryojax.coordinates import make_frequencies
+
+
+def test_gaussian_ice_sample_statistics():
+    """Check the sampling distribution of the gaussian ice model."""
+    ice = cs.GaussianIce()
+    frequency_grid_in_angstroms = make_frequencies((8, 8), 1.0) / 1.1
+    keys = jr.split(jr.PRNGKey(1234), 5000)
+    samples = jax.vmap(lambda key: ice.sample(key, frequency_grid_in_angstroms))(keys)
+    # The zero-frequency bin is zeroed
+    np.testing.assert_array_equal(samples[:, 0, 0], 0.0)
+    # The self-conjugate nyquist bin of the zero-frequency column must
+    # be real-valued
+    np.testing.assert_array_equal(samples[:, 4, 0].imag, 0.0)
+    # The per-bin variance matches the square of the variance kernel,
+    # including at the real-valued nyquist bin
+    expected = jnp.square(ice.variance(frequency_grid_in_angstroms)).at[0, 0].set(0.0)
+    observed = jnp.mean(jnp.abs(samples) ** 2, axis=0)
+    np.testing.assert_allclose(observed, expected, rtol=0.15, atol=1e-12)
+
+
+def test_gaussian_ice_variance_buffer():
+    """Make sure the precomputed variance buffer matches the dynamic path."""
+    frequency_grid_in_angstroms = make_frequencies((8, 8), 1.0) / 1.1
+    key = jr.PRNGKey(0)
+    dynamic = cs.GaussianIce()
+    precomputed = cs.GaussianIce(
+        frequency_grid_in_angstroms=frequency_grid_in_angstroms
+    )
+    np.testing.assert_array_equal(
+        precomputed.sample(key, frequency_grid_in_angstroms),
+        dynamic.sample(key, frequency_grid_in_angstroms),
+    )
+    # A buffer built for a different grid shape is rejected
+    with pytest.raises(ValueError):
+        precomputed.sample(key, make_frequencies((16, 16), 1.0))